@@ -9,45 +9,107 @@ at 48px than 5x5.
 """
 
 import hashlib
-import colorsys
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageDraw, ImageFont
 
+import numpy as np
+from PIL import Image, ImageDraw
 
-def identicon_data(name: str, grid_size: int = 5):
-    """Generate identicon parameters from a workspace name."""
-    h = hashlib.sha256(name.encode('utf-8')).digest()
+from identicon_common import fg_color, load_font, parse_save_options, workspace_hash
 
-    hue = (h[0] | (h[1] << 8)) % 360
-    sat = 0.5 + (h[2] / 255.0) * 0.3
-    light = 0.4 + (h[3] / 255.0) * 0.25
 
-    r, g, b = colorsys.hls_to_rgb(hue / 360.0, light, sat)
-    fg_color = (int(r * 255), int(g * 255), int(b * 255))
+def identicons_batch(names, grid_size=5):
+    """Derive identicons for many names, in struct-of-arrays layout.
 
-    half = (grid_size + 1) // 2
-    bits_needed = grid_size * half
-    bits = int.from_bytes(h[4:8], 'little')
-
-    grid = [[False] * grid_size for _ in range(grid_size)]
-    for row in range(grid_size):
-        for col in range(half):
-            bit_index = row * half + col
-            on = bool(bits & (1 << bit_index))
-            grid[row][col] = on
-            grid[row][grid_size - 1 - col] = on
-
-    return fg_color, grid
+    Colors come from the memoized fg_color one name at a time; the grid
+    patterns are unpacked and mirrored for all names at once. Returns
+    (fg, grids): an (N, 3) uint8 array of foreground colors and an
+    (N, grid_size, grid_size) bool array of patterns, both read-only.
+    """
+    seeds = [workspace_hash(name)[:8] for name in names]
+    h = np.frombuffer(b''.join(seeds), dtype=np.uint8).reshape(-1, 8)
 
+    # Color: hue from bytes 0-1, saturation/lightness from bytes 2-3; the
+    # memoized fg_color is shared with identicon_gen.py
+    fg = np.array([fg_color((seed[0] | (seed[1] << 8)) % 360, seed[2], seed[3])
+                   for seed in seeds], dtype=np.uint8).reshape(-1, 3)
 
-def draw_tile(draw, x, y, tile_w, tile_h, name, grid_size=5, show_status=True, scale=1):
-    """Draw a complete tile with identicon, status dot, and label."""
-    fg_color, grid = identicon_data(name, grid_size)
-    bg_color = (30, 30, 36)
-
-    # Tile background
-    draw.rectangle([x, y, x + tile_w - 1, y + tile_h - 1], fill=bg_color)
-
+    # Grid: unpack every name's pattern bits at once, then mirror. Grids
+    # needing more than the 32 pattern bits read zeros past the end, as
+    # int.from_bytes(h[4:8]) would.
+    half = (grid_size + 1) // 2
+    bits = np.unpackbits(h[:, 4:8], axis=1, bitorder='little')
+    if bits.shape[1] < grid_size * half:
+        bits = np.pad(bits, ((0, 0), (0, grid_size * half - bits.shape[1])))
+    left = bits[:, :grid_size * half].reshape(-1, grid_size, half).astype(bool)
+    grids = np.concatenate([left, left[:, :, :grid_size - half][:, :, ::-1]], axis=2)
+
+    fg.flags.writeable = False
+    grids.flags.writeable = False
+    return fg, grids
+
+
+# Rendered tiles are cached in memory, bounded to the most recently used
+# TILE_MEMORY_MAX. Setting LITE_EDIT_TILE_CACHE=1 also persists small batches
+# as PNGs so repeated runs skip rasterization; decoding a PNG costs more than
+# rasterizing a tile in bulk, so the disk tier is opt-in, skipped for batches
+# of JIT_MIN_BATCH or more, and trimmed to the newest TILE_CACHE_MAX_FILES.
+# Bump the version whenever tile rendering changes so stale files on disk are
+# never reused.
+TILE_MEMORY_MAX = 1024
+TILE_CACHE_DIR = Path.home() / ".cache" / "lite-edit" / "identicons"
+TILE_CACHE_VERSION = 3
+TILE_CACHE_MAX_FILES = 2048
+_disk_index = None
+
+
+def _disk_cache_enabled():
+    return os.environ.get("LITE_EDIT_TILE_CACHE") == "1"
+
+
+def _tile_cache_path(key):
+    digest = hashlib.blake2b(repr((TILE_CACHE_VERSION,) + key).encode('utf-8'),
+                             digest_size=16).hexdigest()
+    return TILE_CACHE_DIR / f"{digest}.png"
+
+
+def _disk_cached_tiles():
+    """Index the on-disk tile cache once per process."""
+    global _disk_index
+    if _disk_index is None:
+        try:
+            _disk_index = {p.name for p in TILE_CACHE_DIR.glob("*.png")}
+        except OSError:
+            _disk_index = set()
+    return _disk_index
+
+
+def _trim_disk_cache():
+    """Delete the oldest-written tiles once the cache exceeds its file limit."""
+    index = _disk_cached_tiles()
+    if len(index) <= TILE_CACHE_MAX_FILES:
+        return
+    try:
+        paths = sorted(TILE_CACHE_DIR.glob("*.png"), key=lambda p: p.stat().st_mtime)
+    except OSError:
+        return
+    for path in paths[:len(paths) - TILE_CACHE_MAX_FILES]:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        index.discard(path.name)
+
+
+@lru_cache(maxsize=None)
+def _tile_geometry(tile_w, tile_h, grid_size, scale):
+    """Cell size and grid origin of the identicon within a tile.
+
+    Depends only on the tile shape, so it is computed once per sheet layout.
+    """
     # Identicon - fill most of the tile
     padding = 4 * scale
     icon_area_w = tile_w - 2 * padding
@@ -55,174 +117,409 @@ def draw_tile(draw, x, y, tile_w, tile_h, name, grid_size=5, show_status=True, s
     cell_w = icon_area_w // grid_size
     cell_h = icon_area_h // grid_size
 
-    gx = x + (tile_w - cell_w * grid_size) // 2
-    gy = y + (tile_h - cell_h * grid_size) // 2
+    gx = (tile_w - cell_w * grid_size) // 2
+    gy = (tile_h - cell_h * grid_size) // 2
+    return cell_w, cell_h, gx, gy
+
 
-    # Draw dimmed background cells for "off" cells (subtle grid)
-    dim_color = tuple(c // 5 for c in fg_color)
+@lru_cache(maxsize=None)
+def _fill_kernel():
+    """Compile the optional Numba fill kernel on first use.
+
+    Returns None when Numba is not installed. Numba is imported here rather
+    than at module level because it is only worth its import cost for large
+    batches.
+    """
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(cache=True, parallel=True)
+    def fill(fg, dim, grids, out, cell_w, cell_h, gx, gy):
+        """Rasterize tile t from fg[t], dim[t] and grids[t] into out (N, tile_h, tile_w, 3)."""
+        grid_size = grids.shape[1]
+        for t in prange(grids.shape[0]):
+            # Tile background
+            out[t, :, :, 0] = 30
+            out[t, :, :, 1] = 30
+            out[t, :, :, 2] = 36
+
+            # Paint the whole grid area as dimmed "off" cells (subtle grid),
+            # then fill only the "on" cells
+            for c in range(3):
+                out[t, gy:gy + cell_h * grid_size, gx:gx + cell_w * grid_size, c] = dim[t, c]
+
+            for row in range(grid_size):
+                cy = gy + row * cell_h
+                for col in range(grid_size):
+                    if grids[t, row, col]:
+                        cx = gx + col * cell_w
+                        for c in range(3):
+                            out[t, cy:cy + cell_h, cx:cx + cell_w, c] = fg[t, c]
+
+    return fill
+
+
+def _make_render(tile_w, tile_h, grid_size, scale):
+    """Generate a tile rasterizer specialized for one tile geometry.
+
+    The returned render(fg, dim, grids, out) fills out (N, tile_h, tile_w, 3)
+    from fg[t], dim[t] and grids[t] like a generic cell loop would, but with
+    every cell rectangle unrolled into straight-line slice assignments with
+    constant bounds. Mirrored cells share one test of the left-half bit.
+    """
+    cell_w, cell_h, gx, gy = _tile_geometry(tile_w, tile_h, grid_size, scale)
+    half = (grid_size + 1) // 2
+
+    def fill(y0, x0, h, w, color, indent):
+        return [f"{indent}out[t, {y0}:{y0 + h}, {x0}:{x0 + w}, {c}] = {color}[t, {c}]"
+                for c in range(3)]
+
+    lines = [
+        "def render(fg, dim, grids, out):",
+        "    for t in range(grids.shape[0]):",
+        # Tile background
+        "        out[t, :, :, 0] = 30",
+        "        out[t, :, :, 1] = 30",
+        "        out[t, :, :, 2] = 36",
+    ]
+    # Paint the whole grid area as dimmed "off" cells (subtle grid), then
+    # fill only the "on" cells
+    lines += fill(gy, gx, cell_h * grid_size, cell_w * grid_size, "dim", " " * 8)
     for row in range(grid_size):
-        for col in range(grid_size):
-            cx = gx + col * cell_w
-            cy = gy + row * cell_h
-            if grid[row][col]:
-                draw.rectangle([cx, cy, cx + cell_w - 1, cy + cell_h - 1], fill=fg_color)
+        for col in range(half):
+            lines.append(f"        if grids[t, {row}, {col}]:")
+            for mirror_col in sorted({col, grid_size - 1 - col}):
+                lines += fill(gy + row * cell_h, gx + mirror_col * cell_w,
+                              cell_h, cell_w, "fg", " " * 12)
+
+    # Left as plain Python: compiling the unrolled source with Numba takes
+    # tens of seconds and exec'd code can't use Numba's on-disk cache
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["render"]
+
+
+# Batches at least this large go to the Numba fill kernel when it is available
+JIT_MIN_BATCH = 256
+
+# Specialized rasterizers by (tile_w, tile_h, grid_size, scale); the sheet
+# geometries are registered up front and any other is generated on first use
+RENDERERS = {
+    geometry: _make_render(*geometry)
+    for geometry in ((48, 48, 5, 1), (48, 48, 3, 1), (96, 96, 5, 2))
+}
+
+
+def _renderer(tile_w, tile_h, grid_size, scale):
+    geometry = (tile_w, tile_h, grid_size, scale)
+    if geometry not in RENDERERS:
+        RENDERERS[geometry] = _make_render(*geometry)
+    return RENDERERS[geometry]
+
+
+_tile_memory = OrderedDict()
+
+
+def _tile_key(fg_color, grid, tile_w, tile_h, scale):
+    return (tuple(int(c) for c in fg_color), grid.shape[0], grid.tobytes(),
+            tile_w, tile_h, scale)
+
+
+def _remember_tile(key, tile):
+    _tile_memory[key] = tile
+    _tile_memory.move_to_end(key)
+    if len(_tile_memory) > TILE_MEMORY_MAX:
+        _tile_memory.popitem(last=False)
+
+
+def _load_cached_tile(key):
+    path = _tile_cache_path(key)
+    if path.name not in _disk_cached_tiles():
+        return None
+    try:
+        with Image.open(path) as cached:
+            tile = np.array(cached.convert('RGB'))
+    except OSError:
+        return None
+    tile.flags.writeable = False
+    return tile
+
+
+def _save_cached_tile(key, tile):
+    """Write a tile to the disk cache atomically.
+
+    Sheet workers may render the same tile concurrently, so each writes to
+    its own temporary file and moves it into place with os.replace.
+    """
+    path = _tile_cache_path(key)
+    tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+    try:
+        TILE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(tile).save(str(tmp_path), format='PNG', optimize=False,
+                                   compress_level=1)
+        os.replace(tmp_path, path)
+        _disk_cached_tiles().add(path.name)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def render_tiles(fg, grids, tile_w, tile_h, scale=1):
+    """Render tiles for a batch of identicons from identicons_batch at once.
+
+    Returns a read-only (tile_h, tile_w, 3) uint8 array per row of fg/grids.
+    Tiles already in the memory cache (or the opt-in disk cache) are reused.
+    When a scaled tile's geometry is an exact multiple of the 1x tile, it is
+    upscaled from the 1x pixels (nearest neighbour, same bytes); anything
+    else is rasterized together by one call to the geometry's specialized
+    renderer, or to the optional Numba fill kernel for large batches. New
+    tiles go into the same caches they were looked up in.
+    """
+    keys = [_tile_key(fg[i], grids[i], tile_w, tile_h, scale) for i in range(len(grids))]
+    use_disk = _disk_cache_enabled() and len(keys) < JIT_MIN_BATCH
+    tiles = {}
+    missing = {}
+    for i, key in enumerate(keys):
+        if key in tiles or key in missing:
+            continue
+        tile = _tile_memory.get(key)
+        if tile is None and use_disk:
+            tile = _load_cached_tile(key)
+        if tile is None:
+            missing[key] = i
+        else:
+            tiles[key] = tile
+            _remember_tile(key, tile)
+
+    if missing:
+        idx = np.fromiter(missing.values(), dtype=np.intp, count=len(missing))
+        grid_size = grids.shape[1]
+        geometry = _tile_geometry(tile_w, tile_h, grid_size, scale)
+        base_w, base_h = tile_w // scale, tile_h // scale
+        if (scale > 1 and base_w * scale == tile_w and base_h * scale == tile_h
+                and geometry == tuple(v * scale for v in
+                                      _tile_geometry(base_w, base_h, grid_size, 1))):
+            base = np.stack(render_tiles(fg[idx], grids[idx], base_w, base_h))
+            out = base.repeat(scale, axis=1).repeat(scale, axis=2)
+        else:
+            out = np.empty((len(idx), tile_h, tile_w, 3), dtype=np.uint8)
+            # "Off" cells use the foreground at 1/5 brightness
+            fill = _fill_kernel() if len(idx) >= JIT_MIN_BATCH else None
+            if fill is not None:
+                fill(fg[idx], fg[idx] // 5, grids[idx], out, *geometry)
             else:
-                draw.rectangle([cx, cy, cx + cell_w - 1, cy + cell_h - 1], fill=dim_color)
+                render = _renderer(tile_w, tile_h, grid_size, scale)
+                render(fg[idx], fg[idx] // 5, grids[idx], out)
 
-    # Status indicator dot (top-right corner)
-    if show_status:
-        dot_size = 6 * scale
-        dot_x = x + tile_w - dot_size - 2 * scale
-        dot_y = y + 2 * scale
-        # Green "running" status
-        draw.ellipse([dot_x, dot_y, dot_x + dot_size, dot_y + dot_size],
-                     fill=(50, 200, 50))
+        for key, tile in zip(missing, out):
+            if use_disk:
+                _save_cached_tile(key, tile)
+            tile.flags.writeable = False
+            tiles[key] = tile
+            _remember_tile(key, tile)
+        if use_disk:
+            _trim_disk_cache()
 
+    return [tiles[key] for key in keys]
+
+
+def draw_tile(sheet, x, y, tile):
+    """Blit rendered tile pixels into the sheet array at (x, y)."""
+    sheet[y:y + tile.shape[0], x:x + tile.shape[1]] = tile
 
-def main():
-    workspace_names = [
-        "project-alpha", "project-beta", "project-gamma", "project-delta",
-        "main", "feature/auth", "feature/ui", "bugfix/crash",
-        "untitled", "untitled-2", "workspace-1", "workspace-2",
-    ]
 
+@lru_cache(maxsize=None)
+def _status_dot(scale):
+    """Green "running" status dot rendered once per scale as an RGBA sprite."""
+    dot_size = 6 * scale
+    sprite = Image.new('RGBA', (dot_size + 1, dot_size + 1), (0, 0, 0, 0))
+    ImageDraw.Draw(sprite).ellipse([0, 0, dot_size, dot_size], fill=(50, 200, 50, 255))
+    return sprite
+
+
+def draw_status(img, x, y, tile_w, scale=1):
+    """Paste the status indicator dot in the top-right corner of a tile."""
+    dot = _status_dot(scale)
+    dot_x = x + tile_w - 6 * scale - 2 * scale
+    dot_y = y + 2 * scale
+    img.paste(dot, (dot_x, dot_y), dot)
+
+
+SHEET_BG = (20, 20, 24)
+
+# Below this many tiles across all sheets, a process pool costs more than it
+# saves
+PARALLEL_MIN_TILES = 4096
+
+
+def _render_grid_sheet(names, identicons, title, tile_w, tile_h, label_h, top,
+                       font, scale=1, shorten_labels=True):
+    """Lay tiles out 4 across with a title and name labels; returns the Image."""
     cols = 4
     rows = 3
     padding = 12
-
-    # ---- Sheet 1: 5x5 identicons at actual tile size (48x48) ----
-    tile_w, tile_h = 48, 48
-    label_h = 14
     sheet_w = cols * (tile_w + padding) + padding
-    sheet_h = rows * (tile_h + label_h + padding) + padding + 20
+    sheet_h = rows * (tile_h + label_h + padding) + padding + top
 
-    img = Image.new('RGB', (sheet_w, sheet_h), color=(20, 20, 24))
+    positions = []
+    for i, name in enumerate(names):
+        col = i % cols
+        row = i // cols
+        positions.append((name,
+                          padding + col * (tile_w + padding),
+                          top + row * (tile_h + label_h + padding)))
+
+    # The sheet is assembled as one pixel array: tiles are blitted in with
+    # slice assignment, then status dot sprites are pasted on and a single
+    # ImageDraw pass adds the text.
+    # Every tile on a sheet shares one shape, so they are rendered together
+    # and the per-tile work is just the blit.
+    tiles = render_tiles(*identicons, tile_w, tile_h, scale=scale)
+    sheet = np.full((sheet_h, sheet_w, 3), SHEET_BG, dtype=np.uint8)
+    for (name, tx, ty), tile in zip(positions, tiles):
+        draw_tile(sheet, tx, ty, tile)
+
+    img = Image.fromarray(sheet)
     draw = ImageDraw.Draw(img)
 
-    try:
-        font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 9)
-    except:
-        font = ImageFont.load_default()
-
     # Title
-    draw.text((padding, 4), "5x5 grid @ 48px", fill=(150, 150, 160), font=font)
+    draw.text((padding, 4), title, fill=(150, 150, 160), font=font)
 
-    for i, name in enumerate(workspace_names):
-        col = i % cols
-        row = i // cols
-        tx = padding + col * (tile_w + padding)
-        ty = 20 + row * (tile_h + label_h + padding)
-        draw_tile(draw, tx, ty, tile_w, tile_h, name, grid_size=5)
+    for name, tx, ty in positions:
+        draw_status(img, tx, ty, tile_w, scale=scale)
 
-        display = name if len(name) <= 14 else name[:12] + ".."
+        display = name
+        if shorten_labels and len(name) > 14:
+            display = name[:12] + ".."
         bbox = draw.textbbox((0, 0), display, font=font)
         tw = bbox[2] - bbox[0]
         draw.text((tx + (tile_w - tw) // 2, ty + tile_h + 1),
                   display, fill=(140, 140, 150), font=font)
 
-    out1 = Path(__file__).parent / "hybrid_5x5_48px.png"
-    img.save(str(out1))
-    print(f"Saved: {out1}")
-
-    # ---- Sheet 2: 3x3 identicons at actual tile size ----
-    img2 = Image.new('RGB', (sheet_w, sheet_h), color=(20, 20, 24))
-    draw2 = ImageDraw.Draw(img2)
-    draw2.text((padding, 4), "3x3 grid @ 48px", fill=(150, 150, 160), font=font)
-
-    for i, name in enumerate(workspace_names):
-        col = i % cols
-        row = i // cols
-        tx = padding + col * (tile_w + padding)
-        ty = 20 + row * (tile_h + label_h + padding)
-        draw_tile(draw2, tx, ty, tile_w, tile_h, name, grid_size=3)
-
-        display = name if len(name) <= 14 else name[:12] + ".."
-        bbox = draw2.textbbox((0, 0), display, font=font)
-        tw = bbox[2] - bbox[0]
-        draw2.text((tx + (tile_w - tw) // 2, ty + tile_h + 1),
-                   display, fill=(140, 140, 150), font=font)
-
-    out2 = Path(__file__).parent / "hybrid_3x3_48px.png"
-    img2.save(str(out2))
-    print(f"Saved: {out2}")
+    return img
 
-    # ---- Sheet 3: 2x scale for detail inspection ----
-    scale = 2
-    tile_w2, tile_h2 = 48 * scale, 48 * scale
-    label_h2 = 16
-    sheet_w2 = cols * (tile_w2 + padding) + padding
-    sheet_h2 = rows * (tile_h2 + label_h2 + padding) + padding + 24
 
-    img3 = Image.new('RGB', (sheet_w2, sheet_h2), color=(20, 20, 24))
-    draw3 = ImageDraw.Draw(img3)
+def render_sheet_1(names, identicons, out_path, save_opts):
+    """Sheet 1: 5x5 identicons at actual tile size (48x48)."""
+    img = _render_grid_sheet(names, identicons, "5x5 grid @ 48px",
+                             48, 48, label_h=14, top=20, font=load_font(9))
+    img.save(str(out_path), **save_opts)
+    return out_path
 
-    try:
-        font2 = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 11)
-    except:
-        font2 = ImageFont.load_default()
 
-    draw3.text((padding, 4), "5x5 grid @ 96px (2x zoom for inspection)", fill=(150, 150, 160), font=font2)
+def render_sheet_2(names, identicons, out_path, save_opts):
+    """Sheet 2: 3x3 identicons at actual tile size."""
+    img = _render_grid_sheet(names, identicons, "3x3 grid @ 48px",
+                             48, 48, label_h=14, top=20, font=load_font(9))
+    img.save(str(out_path), **save_opts)
+    return out_path
 
-    for i, name in enumerate(workspace_names):
-        col = i % cols
-        row = i // cols
-        tx = padding + col * (tile_w2 + padding)
-        ty = 24 + row * (tile_h2 + label_h2 + padding)
-        draw_tile(draw3, tx, ty, tile_w2, tile_h2, name, grid_size=5, scale=scale)
 
-        bbox = draw3.textbbox((0, 0), name, font=font2)
-        tw = bbox[2] - bbox[0]
-        draw3.text((tx + (tile_w2 - tw) // 2, ty + tile_h2 + 1),
-                   name, fill=(140, 140, 150), font=font2)
+def render_sheet_3(names, identicons, out_path, save_opts):
+    """Sheet 3: 2x scale for detail inspection."""
+    scale = 2
+    img = _render_grid_sheet(names, identicons, "5x5 grid @ 96px (2x zoom for inspection)",
+                             48 * scale, 48 * scale, label_h=16, top=24,
+                             font=load_font(11), scale=scale, shorten_labels=False)
+    img.save(str(out_path), **save_opts)
+    return out_path
 
-    out3 = Path(__file__).parent / "hybrid_5x5_96px.png"
-    img3.save(str(out3))
-    print(f"Saved: {out3}")
 
-    # ---- Sheet 4: Simulated left rail (vertical strip) ----
+def render_sheet_4(names, identicons, out_path, save_opts):
+    """Sheet 4: Simulated left rail (vertical strip)."""
     rail_w = 56
     rail_tile_h = 48
     rail_spacing = 4
     rail_top = 8
-    n_visible = min(8, len(workspace_names))
+    n_visible = min(8, len(names))
+    fg, grids = identicons[0][:n_visible], identicons[1][:n_visible]
+    rail_bg = (30, 30, 36)
+    active_color = (100, 140, 255)
 
     rail_h = rail_top + n_visible * (rail_tile_h + rail_spacing)
     # Put 1x on left, 2x on right for comparison
-    img4 = Image.new('RGB', (rail_w + 40 + rail_w * 2, rail_h * 2), color=(20, 20, 24))
-    draw4 = ImageDraw.Draw(img4)
+    sheet = np.full((rail_h * 2, rail_w + 40 + rail_w * 2, 3), SHEET_BG, dtype=np.uint8)
 
     # Rail background
-    draw4.rectangle([0, 0, rail_w - 1, rail_h * 2 - 1], fill=(30, 30, 36))
+    sheet[:, :rail_w] = rail_bg
 
+    rail_tiles = []
+    tiles = render_tiles(fg, grids, rail_w - 8, rail_tile_h)
     for i in range(n_visible):
-        name = workspace_names[i]
         tile_x = 4
         tile_y = rail_top + i * (rail_tile_h + rail_spacing)
-        draw_tile(draw4, tile_x, tile_y, rail_w - 8, rail_tile_h, name, grid_size=5)
+        draw_tile(sheet, tile_x, tile_y, tiles[i])
+        rail_tiles.append((tile_x, tile_y, rail_w - 8, 1))
 
         # Active indicator for first tile
         if i == 0:
-            draw4.rectangle([0, tile_y, 2, tile_y + rail_tile_h - 1], fill=(100, 140, 255))
+            sheet[tile_y:tile_y + rail_tile_h, 0:3] = active_color
 
     # 2x version on the right
     x_off = rail_w + 40
-    draw4.rectangle([x_off, 0, x_off + rail_w * 2 - 1, rail_h * 2 - 1], fill=(30, 30, 36))
+    sheet[:, x_off:x_off + rail_w * 2] = rail_bg
 
+    tiles = render_tiles(fg, grids, (rail_w - 8) * 2, rail_tile_h * 2, scale=2)
     for i in range(n_visible):
-        name = workspace_names[i]
         tile_x = x_off + 8
         tile_y = rail_top * 2 + i * ((rail_tile_h + rail_spacing) * 2)
         if tile_y + rail_tile_h * 2 > rail_h * 2:
             break
-        draw_tile(draw4, tile_x, tile_y, (rail_w - 8) * 2, rail_tile_h * 2, name, grid_size=5, scale=2)
+        draw_tile(sheet, tile_x, tile_y, tiles[i])
+        rail_tiles.append((tile_x, tile_y, (rail_w - 8) * 2, 2))
 
         if i == 0:
-            draw4.rectangle([x_off, tile_y, x_off + 4, tile_y + rail_tile_h * 2 - 1],
-                           fill=(100, 140, 255))
+            sheet[tile_y:tile_y + rail_tile_h * 2, x_off:x_off + 5] = active_color
+
+    img = Image.fromarray(sheet)
+    for tile_x, tile_y, rail_tile_w, tile_scale in rail_tiles:
+        draw_status(img, tile_x, tile_y, rail_tile_w, scale=tile_scale)
+
+    img.save(str(out_path), **save_opts)
+    return out_path
+
+
+def main():
+    save_opts = parse_save_options(__doc__)
+
+    workspace_names = [
+        "project-alpha", "project-beta", "project-gamma", "project-delta",
+        "main", "feature/auth", "feature/ui", "bugfix/crash",
+        "untitled", "untitled-2", "workspace-1", "workspace-2",
+    ]
+
+    # Identicon data is derived once per grid size here, as (fg, grids)
+    # arrays, and handed to the sheet workers so none of them re-hash.
+    identicons5 = identicons_batch(workspace_names, 5)
+    identicons3 = identicons_batch(workspace_names, 3)
+
+    out_dir = Path(__file__).parent
+    sheets = [
+        (render_sheet_1, identicons5, out_dir / "hybrid_5x5_48px.png"),
+        (render_sheet_2, identicons3, out_dir / "hybrid_3x3_48px.png"),
+        (render_sheet_3, identicons5, out_dir / "hybrid_5x5_96px.png"),
+        (render_sheet_4, identicons5, out_dir / "simulated_rail.png"),
+    ]
 
-    out4 = Path(__file__).parent / "simulated_rail.png"
-    img4.save(str(out4))
-    print(f"Saved: {out4}")
+    # Worker start-up (re-importing numpy and PIL under spawn) outweighs the
+    # rendering itself for small name lists, so those render in-process
+    if len(sheets) * len(workspace_names) < PARALLEL_MIN_TILES:
+        for render, identicons, out_path in sheets:
+            print(f"Saved: {render(workspace_names, identicons, out_path, save_opts)}")
+        return
+
+    # Name lists this large outgrow the tile memory cache, so sharing tiles
+    # between sheets saves little; each sheet renders and saves in its own
+    # process
+    with ProcessPoolExecutor(max_workers=len(sheets)) as executor:
+        futures = [executor.submit(render, workspace_names, identicons, out_path, save_opts)
+                   for render, identicons, out_path in sheets]
+        for future in futures:
+            print(f"Saved: {future.result()}")
 
 
 if __name__ == "__main__":
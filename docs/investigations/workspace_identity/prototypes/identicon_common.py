@@ -0,0 +1,75 @@
+"""
+Helpers shared by the workspace identicon prototypes (identicon_gen.py and
+hybrid_gen.py): the name hash, hash-to-color mapping, label fonts, and PNG
+output options.
+
+Only the standard library is imported at module level so the text-only
+fallback in identicon_gen.py keeps working without PIL.
+"""
+
+import argparse
+import hashlib
+from functools import lru_cache
+
+
+def workspace_hash(name: str) -> bytes:
+    """SHA-256 digest of a workspace name, the seed for its identicon."""
+    # Keep SHA-256 so patterns match hash_workspace_label() in
+    # crates/editor/src/left_rail.rs; callers memoize per name, so it runs
+    # once per name.
+    return hashlib.sha256(name.encode('utf-8')).digest()
+
+
+@lru_cache(maxsize=None)
+def fg_color(hue, sat_byte, light_byte):
+    """Map the color hash bytes to an RGB foreground color.
+
+    Hue is 0-360; byte 2 varies saturation (0.5-0.8) and byte 3 lightness
+    (0.4-0.65). Inlined equivalent of colorsys.hls_to_rgb (same arithmetic,
+    so the same 8-bit results) memoized per (hue, saturation byte, lightness
+    byte).
+    """
+    sat = 0.5 + (sat_byte / 255.0) * 0.3
+    light = 0.4 + (light_byte / 255.0) * 0.25
+    m2 = light * (1.0 + sat) if light <= 0.5 else light + sat - (light * sat)
+    m1 = 2.0 * light - m2
+    h = hue / 360.0
+    rgb = []
+    for channel_hue in (h + 1.0 / 3.0, h, h - 1.0 / 3.0):
+        channel_hue %= 1.0
+        if channel_hue < 1.0 / 6.0:
+            v = m1 + (m2 - m1) * channel_hue * 6.0
+        elif channel_hue < 0.5:
+            v = m2
+        elif channel_hue < 2.0 / 3.0:
+            v = m1 + (m2 - m1) * (2.0 / 3.0 - channel_hue) * 6.0
+        else:
+            v = m1
+        rgb.append(int(v * 255))
+    return tuple(rgb)
+
+
+@lru_cache(maxsize=None)
+def load_font(size: int):
+    """Load the label font once per size instead of once per tile."""
+    from PIL import ImageFont
+    try:
+        return ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", size)
+    except:
+        return ImageFont.load_default()
+
+
+def png_options(compact=False):
+    """PNG save options: fast encoding by default, smallest files if compact."""
+    if compact:
+        return {'format': 'PNG', 'compress_level': 9, 'optimize': True}
+    return {'format': 'PNG', 'compress_level': 1, 'optimize': False}
+
+
+def parse_save_options(description):
+    """Parse the prototypes' shared command line and return PNG save options."""
+    parser = argparse.ArgumentParser(description=description,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--compact", action="store_true",
+                        help="spend more time encoding to write smaller PNGs")
+    return png_options(parser.parse_args().compact)
@@ -15,51 +15,55 @@ Algorithm:
 - Render at 48x48 pixels per identicon (matching the tile size)
 """
 
-import hashlib
-import colorsys
 import struct
+from functools import lru_cache
 from pathlib import Path
 
-# Try PIL first, fall back to pure-text output
+from identicon_common import fg_color, load_font, parse_save_options, workspace_hash
+
+# Try PIL (and NumPy, used to rasterize tiles) first, fall back to pure-text
+# output
 try:
-    from PIL import Image, ImageDraw, ImageFont
+    import numpy as np
+    from PIL import Image, ImageDraw
     HAS_PIL = True
 except ImportError:
     HAS_PIL = False
 
 
+@lru_cache(maxsize=1024)
 def generate_identicon_data(name: str):
-    """Generate identicon parameters from a workspace name."""
-    h = hashlib.sha256(name.encode('utf-8')).digest()
+    """Generate identicon parameters from a workspace name.
+
+    Memoized per name; the grid is returned as a tuple of row tuples so the
+    cached value can be shared between callers.
+    """
+    h = workspace_hash(name)
 
     # Color: use first 2 bytes for hue (0-360), fix saturation and lightness
     hue = (h[0] | (h[1] << 8)) % 360
-    # Use byte 2 to slightly vary saturation (0.5-0.8)
-    sat = 0.5 + (h[2] / 255.0) * 0.3
-    # Use byte 3 to slightly vary lightness (0.4-0.65)
-    light = 0.4 + (h[3] / 255.0) * 0.25
-
-    r, g, b = colorsys.hls_to_rgb(hue / 360.0, light, sat)
-    fg_color = (int(r * 255), int(g * 255), int(b * 255))
+    # Byte 2 slightly varies saturation (0.5-0.8), byte 3 lightness (0.4-0.65)
+    fg = fg_color(hue, h[2], h[3])
 
     # Grid: 5x5 with vertical symmetry
     # We need 15 bits (5 rows × 3 columns, mirrored to make 5 cols)
     # Use bytes 4-5 for the pattern bits
     bits = h[4] | (h[5] << 8)
 
-    grid = [[False] * 5 for _ in range(5)]
+    grid = []
     for row in range(5):
-        for col in range(3):  # Only left half + center
-            bit_index = row * 3 + col
-            on = bool(bits & (1 << bit_index))
-            grid[row][col] = on
-            grid[row][4 - col] = on  # Mirror
+        left = [bool(bits & (1 << (row * 3 + col))) for col in range(3)]  # Only left half + center
+        grid.append(tuple(left + left[1::-1]))  # Mirror
+    grid = tuple(grid)
+
+    return fg, grid
 
-    return fg_color, grid
 
+def render_identicon_pil(img, draw, x_offset, y_offset, size, name, label=True, font=None):
+    """Render a single identicon using PIL at the given offset.
 
-def render_identicon_pil(draw, x_offset, y_offset, size, name, label=True):
-    """Render a single identicon using PIL at the given offset."""
+    Pass the label font in when rendering many tiles so it is loaded once.
+    """
     fg_color, grid = generate_identicon_data(name)
 
     # Background for the tile
@@ -77,20 +81,19 @@ def render_identicon_pil(draw, x_offset, y_offset, size, name, label=True):
     gx = x_offset + (size - grid_size) // 2
     gy = y_offset + (size - grid_size) // 2
 
-    for row in range(5):
-        for col in range(5):
-            if grid[row][col]:
-                cx = gx + col * cell_size
-                cy = gy + row * cell_size
-                draw.rectangle([cx, cy, cx + cell_size - 1, cy + cell_size - 1],
-                               fill=fg_color)
+    # Rasterize the grid in one pass: map every pixel to its cell, then pick
+    # the foreground or tile background per pixel
+    cell_idx = np.arange(grid_size) // cell_size
+    cell_on = np.array(grid, dtype=bool)[cell_idx[:, None], cell_idx[None, :]]
+    pixels = np.where(cell_on[..., None],
+                      np.array(fg_color, dtype=np.uint8),
+                      np.array(bg_color, dtype=np.uint8))
+    img.paste(Image.fromarray(pixels), (gx, gy))
 
     # Label below
     if label:
-        try:
-            font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 10)
-        except:
-            font = ImageFont.load_default()
+        if font is None:
+            font = load_font(10)
         # Truncate long names for display
         display_name = name if len(name) <= 16 else name[:14] + ".."
         bbox = draw.textbbox((0, 0), display_name, font=font)
@@ -115,6 +118,8 @@ def render_text_identicon(name: str) -> str:
 
 
 def main():
+    save_opts = parse_save_options(__doc__)
+
     # Test workspace names: mix of similar and different names
     workspace_names = [
         # Similar names (testing H2 - hash entropy)
@@ -145,6 +150,8 @@ def main():
         sheet_w = cols * (tile_size + padding) + padding
         sheet_h = rows * (tile_size + label_height + padding) + padding
 
+        label_font = load_font(10)
+
         img = Image.new('RGB', (sheet_w, sheet_h), color=(20, 20, 24))
         draw = ImageDraw.Draw(img)
 
@@ -153,10 +160,10 @@ def main():
             row = i // cols
             x = padding + col * (tile_size + padding)
             y = padding + row * (tile_size + label_height + padding)
-            render_identicon_pil(draw, x, y, tile_size, name)
+            render_identicon_pil(img, draw, x, y, tile_size, name, font=label_font)
 
         out_path = Path(__file__).parent / "identicon_comparison.png"
-        img.save(str(out_path))
+        img.save(str(out_path), **save_opts)
         print(f"Saved comparison sheet to {out_path}")
 
         # Also render at 2x for easier inspection
@@ -171,10 +178,10 @@ def main():
             row = i // cols
             x = padding + col * (tile_size_2x + padding)
             y = padding + row * (tile_size_2x + label_height + padding)
-            render_identicon_pil(draw2, x, y, tile_size_2x, name)
+            render_identicon_pil(img2, draw2, x, y, tile_size_2x, name, font=label_font)
 
         out_path_2x = Path(__file__).parent / "identicon_comparison_2x.png"
-        img2.save(str(out_path_2x))
+        img2.save(str(out_path_2x), **save_opts)
         print(f"Saved 2x comparison sheet to {out_path_2x}")
 
         # Render the "colored initial" alternative (H3)
@@ -183,6 +190,7 @@ def main():
         sheet_h_alt = rows * (tile_size_alt + label_height + padding) + padding
         img_alt = Image.new('RGB', (sheet_w_alt, sheet_h_alt), color=(20, 20, 24))
         draw_alt = ImageDraw.Draw(img_alt)
+        initial_font = load_font(24)
 
         for i, name in enumerate(workspace_names):
             col = i % cols
@@ -197,30 +205,22 @@ def main():
 
             # Draw initial letter centered
             initial = name[0].upper()
-            try:
-                font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 24)
-            except:
-                font = ImageFont.load_default()
-            bbox = draw_alt.textbbox((0, 0), initial, font=font)
+            bbox = draw_alt.textbbox((0, 0), initial, font=initial_font)
             tw, th = bbox[2] - bbox[0], bbox[3] - bbox[1]
             tx = x + (tile_size_alt - tw) // 2
             ty = y + (tile_size_alt - th) // 2 - 2
-            draw_alt.text((tx, ty), initial, fill=fg_color, font=font)
+            draw_alt.text((tx, ty), initial, fill=fg_color, font=initial_font)
 
             # Label
-            try:
-                small_font = ImageFont.truetype("/System/Library/Fonts/Menlo.ttc", 10)
-            except:
-                small_font = ImageFont.load_default()
             display_name = name if len(name) <= 16 else name[:14] + ".."
-            bbox2 = draw_alt.textbbox((0, 0), display_name, font=small_font)
+            bbox2 = draw_alt.textbbox((0, 0), display_name, font=label_font)
             tw2 = bbox2[2] - bbox2[0]
             tx2 = x + (tile_size_alt - tw2) // 2
             ty2 = y + tile_size_alt + 2
-            draw_alt.text((tx2, ty2), display_name, fill=(180, 180, 190), font=small_font)
+            draw_alt.text((tx2, ty2), display_name, fill=(180, 180, 190), font=label_font)
 
         out_path_alt = Path(__file__).parent / "colored_initial_comparison.png"
-        img_alt.save(str(out_path_alt))
+        img_alt.save(str(out_path_alt), **save_opts)
         print(f"Saved colored-initial comparison to {out_path_alt}")
 
     else: